@@ -3,32 +3,18 @@ import pytesseract
 import pandas as pd
 import tkinter as tk
 import difflib
+import functools
+import json
+import os
+from collections import namedtuple
+import numpy as np
 from PIL import Image, ImageTk
 from langdetect import detect
 
-DEFAULT_RESOLUTION = (2560, 1440)
 NUM_ROWS = 10
-
-COLUMNS_2560 = {
-    'Player': (474, 852),
-    'ACS': (987, 1037),
-    'K': (1149, 1190),
-    'D': (1220, 1251),
-    'A': (1288, 1318),
-    'ECON': (1407, 1445),
-    'FIRST BLOODS': (1618, 1648),
-    'PLANTS': (1823, 1842),
-    'DEFUSES': (2027, 2047)
-}
-
-ROW_HEIGHT_2560 = 32
-ROW_SPACING_2560 = 69.7
-SCOREBOARD_ORIGIN_2560 = (445, 475) 
+LAYOUTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'layouts.json')
 TEMPLATE_BBOX = (1180, 428, 1209, 439)
 MAP_NAMES = ["ASCENT", "BIND", "PEARL", "SPLIT", "LOTUS", "HAVEN", "ICEBOX", "SUNSET", "BREEZE", "CORRODE"]
-MAP_NAME_BOX = (167, 175, 251, 187)
-TEAM1_ROUNDS_BOX = (970, 120, 1080, 205)
-TEAM2_ROUNDS_BOX = (1400, 120, 1525, 205)
 
 def auto_scale(value, original, actual):
     return int(value * actual / original)
@@ -117,54 +103,139 @@ def detect_language(text):
     except:
         return 'unknown'
 
-def extract_scoreboard(image_path):
-    img = cv2.imread(image_path)
-    if img is None:
-        raise ValueError("Could not load image")
+def load_layout_profiles(path=LAYOUTS_PATH):
+    """
+    Load the per-resolution layout profiles. Each profile describes the
+    scoreboard in its own native pixel coordinates.
+    """
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    profiles = {p['name']: p for p in data['profiles']}
+    return profiles, profiles[data['default']]
 
-    img_h, img_w = img.shape[:2]
-    origin_x = auto_scale(SCOREBOARD_ORIGIN_2560[0], DEFAULT_RESOLUTION[0], img_w)
-    origin_y = auto_scale(SCOREBOARD_ORIGIN_2560[1], DEFAULT_RESOLUTION[1], img_h)
-    row_height = auto_scale(ROW_HEIGHT_2560, DEFAULT_RESOLUTION[1], img_h)
-    row_spacing = auto_scale(ROW_SPACING_2560, DEFAULT_RESOLUTION[1], img_h)
-
-    scaled_columns = {
-        k: (auto_scale(x1, DEFAULT_RESOLUTION[0], img_w),
-            auto_scale(x2, DEFAULT_RESOLUTION[0], img_w))
-        for k, (x1, x2) in COLUMNS_2560.items()
-    }
+LAYOUT_PROFILES, DEFAULT_PROFILE = load_layout_profiles()
+
+Layout = namedtuple('Layout', ['profile', 'columns', 'scoreboard', 'map', 'team1', 'team2', 'cells', 'slices'])
+
+def select_profile(img_w, img_h):
+    """
+    Pick the profile for an image size: an exact resolution match first,
+    then the closest profile with the same aspect ratio, else the default.
+    Profiles marked "exact" are hand-tuned for one size and never scaled.
+    """
+    same_aspect = []
+    for profile in LAYOUT_PROFILES.values():
+        pw, ph = profile['resolution']
+        if (pw, ph) == (img_w, img_h):
+            return profile
+        if pw * img_h == ph * img_w and not profile.get('exact'):
+            same_aspect.append(profile)
+    if same_aspect:
+        return min(same_aspect, key=lambda p: abs(p['resolution'][0] - img_w))
+    return DEFAULT_PROFILE
+
+@functools.lru_cache(maxsize=None)
+def compute_layout(img_w, img_h):
+    """
+    Compile the matching profile for the given image size into crop tables.
+    Cached per (width, height), so the geometry is only scaled once per
+    resolution, and returned as an immutable Layout. Boxes are (x1, y1, x2, y2);
+    cells is a NUM_ROWS x columns x 4 array and slices holds the matching
+    (rows, cols) slices for indexing.
+    """
+    profile = select_profile(img_w, img_h)
+    base_w, base_h = profile['resolution']
 
-    col_min_x = min(c[0] for c in scaled_columns.values())
-    col_max_x = max(c[1] for c in scaled_columns.values())
-    scoreboard_width = col_max_x - col_min_x
-    scoreboard_height = (row_spacing * NUM_ROWS) + 20
+    def scale_x(x):
+        return auto_scale(x, base_w, img_w)
 
-    bbox_x1 = origin_x
-    bbox_y1 = origin_y
-    bbox_x2 = origin_x + scoreboard_width
-    bbox_y2 = origin_y + scoreboard_height - auto_scale(45, DEFAULT_RESOLUTION[1], img_h)
+    def scale_y(y):
+        return auto_scale(y, base_h, img_h)
 
-    # Map & round win box scaling
     def scale_box(box):
         x1, y1, x2, y2 = box
-        return (
-            auto_scale(x1, DEFAULT_RESOLUTION[0], img_w),
-            auto_scale(y1, DEFAULT_RESOLUTION[1], img_h),
-            auto_scale(x2, DEFAULT_RESOLUTION[0], img_w),
-            auto_scale(y2, DEFAULT_RESOLUTION[1], img_h)
-        )
+        return (scale_x(x1), scale_y(y1), scale_x(x2), scale_y(y2))
+
+    origin_x = scale_x(profile['origin'][0])
+    origin_y = scale_y(profile['origin'][1])
+    row_height = scale_y(profile['row_height'])
+    row_spacing = scale_y(profile['row_spacing'])
+
+    column_names = tuple(profile['columns'])
+    col_x = np.array([[scale_x(x1), scale_x(x2)] for x1, x2 in profile['columns'].values()])
+    col_x += origin_x - col_x[:, 0].min()
+    row_y = origin_y + np.arange(NUM_ROWS) * row_spacing
+
+    cells = np.empty((NUM_ROWS, len(column_names), 4), dtype=np.int32)
+    cells[:, :, 0] = col_x[:, 0]
+    cells[:, :, 1] = row_y[:, None]
+    cells[:, :, 2] = col_x[:, 1]
+    cells[:, :, 3] = row_y[:, None] + row_height
+    cells.setflags(write=False)
+
+    slices = tuple(
+        tuple((slice(y1, y2), slice(x1, x2)) for x1, y1, x2, y2 in row.tolist())
+        for row in cells
+    )
+
+    return Layout(
+        profile=profile['name'],
+        columns=column_names,
+        scoreboard=(origin_x, origin_y, int(col_x[:, 1].max()), int(cells[-1, 0, 3])),
+        map=scale_box(profile['map_box']),
+        team1=scale_box(profile['team1_rounds_box']),
+        team2=scale_box(profile['team2_rounds_box']),
+        cells=cells,
+        slices=slices
+    )
+
+def draw_debug_overlay(img, layout, output_path):
+    """
+    Draw the layout the extractor actually used onto a copy of the image
+    and save it as a single annotated overlay.
+    """
+    debug_img = img.copy()
+
+    # Scoreboard bbox (red)
+    x1, y1, x2, y2 = layout.scoreboard
+    cv2.rectangle(debug_img, (x1, y1), (x2, y2), (0, 0, 255), 2)
+
+    # Map name (magenta) and round scores (green / red)
+    for key, color in (('map', (255, 0, 255)), ('team1', (0, 255, 0)), ('team2', (0, 0, 255))):
+        x1, y1, x2, y2 = getattr(layout, key)
+        cv2.rectangle(debug_img, (x1, y1), (x2, y2), color, 2)
 
-    map_box = scale_box(MAP_NAME_BOX)
-    team1_box = scale_box(TEAM1_ROUNDS_BOX)
-    team2_box = scale_box(TEAM2_ROUNDS_BOX)
+    # Cells (yellow), labelled with the column name on the first row
+    for row, row_cells in enumerate(layout.cells.tolist()):
+        for col_name, (x1, y1, x2, y2) in zip(layout.columns, row_cells):
+            cv2.rectangle(debug_img, (x1, y1), (x2, y2), (0, 255, 255), 1)
+            if row == 0:
+                cv2.putText(debug_img, col_name, (x1, y1 - 4),
+                            cv2.FONT_HERSHEY_SIMPLEX, 0.4, (0, 255, 255), 1)
 
+    cv2.putText(debug_img, f"Layout {layout.profile}", (10, 30),
+                cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 0, 255), 2)
+
+    cv2.imwrite(output_path, debug_img)
+
+def extract_scoreboard(image_path, debug_output_path=None):
+    img = cv2.imread(image_path)
+    if img is None:
+        raise ValueError("Could not load image")
+
+    img_h, img_w = img.shape[:2]
+    layout = compute_layout(img_w, img_h)
+
+    # Draw before any OCR so the overlay survives a failed extraction
+    if debug_output_path:
+        draw_debug_overlay(img, layout, debug_output_path)
 
     # Read metadata
-    map_crop = crop_box(img, *map_box)
+    map_crop = crop_box(img, *layout.map)
     map_name = extract_map_name(map_crop)
 
-    t1_crop = crop_box(img, *team1_box)
-    t2_crop = crop_box(img, *team2_box)
+    t1_crop = crop_box(img, *layout.team1)
+    t2_crop = crop_box(img, *layout.team2)
     try:
         t1_raw = color_extract_text(t1_crop, color='green')
         t1_score = clean_round_score(t1_raw)
@@ -183,12 +254,9 @@ def extract_scoreboard(image_path):
     # Scoreboard
     player_data = []
     for i in range(NUM_ROWS):
-        row_top = bbox_y1 + i * row_spacing
         row_info = {}
-        for col_name, (col_x1, col_x2) in scaled_columns.items():
-            crop_x1 = bbox_x1 + (col_x1 - col_min_x)
-            crop_x2 = bbox_x1 + (col_x2 - col_min_x)
-            cell = img[row_top:row_top + row_height, crop_x1:crop_x2]
+        for col_name, cell_slice in zip(layout.columns, layout.slices[i]):
+            cell = img[cell_slice]
 
             if col_name == 'Player':
                 primary_text = extract_text(cell, lang='eng')
@@ -208,23 +276,22 @@ def extract_scoreboard(image_path):
             row_info[col_name] = text
         player_data.append(row_info)
 
-
     return map_name, t1_score, t2_score, winner, pd.DataFrame(player_data)
 
 
 
 if __name__ == "__main__":
     import sys
-    import json
 
     if len(sys.argv) < 2:
         print(json.dumps({"error": "No image path provided"}))
         sys.exit(1)
 
     image_path = sys.argv[1]
+    debug_path = sys.argv[2] if len(sys.argv) >= 3 else None
 
     try:
-        map_name, t1, t2, winner, df = extract_scoreboard(image_path)
+        map_name, t1, t2, winner, df = extract_scoreboard(image_path, debug_path)
         print(json.dumps({
             "map": map_name,
             "team1_rounds": t1,